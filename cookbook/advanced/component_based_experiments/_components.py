@@ -1,7 +1,9 @@
+import heapq
 import random
+from functools import lru_cache
 
 # Define some simple search components for demonstration purposes
-SEARCH_DATABASE = {
+SEARCH_DATABASE = frozenset({
     "The quick brown fox jumps over the lazy dog",
     "A journey of a thousand miles begins with a single step",
     "To be or not to be, that is the question",
@@ -9,29 +11,50 @@ SEARCH_DATABASE = {
     "I think, therefore I am",
     "The only thing we have to fear is fear itself",
     "Ask not what your country can do for you; ask what you can do for your country",
-}
+})
+SEARCH_LIST = tuple(SEARCH_DATABASE)
+
+# Normalize the corpus once so per-query matching only scans pre-lowered strings
+SEARCH_LOWER = tuple((item.lower(), item) for item in SEARCH_LIST)
+SEARCH_PARITY = tuple((len(item) % 2, item) for item in SEARCH_LIST)
 
 def random_search(query: str) -> list[str]:
-    k = random.randint(1, len(SEARCH_DATABASE))
-    return random.sample(list(SEARCH_DATABASE), k=k)
+    k = random.randint(1, len(SEARCH_LIST))
+    return random.sample(SEARCH_LIST, k=k)
+
+@lru_cache(maxsize=256)
+def _simple_search(query: str) -> tuple[str, ...]:
+    query_lower = query.lower()
+    return tuple(item for item_lower, item in SEARCH_LOWER if query_lower in item_lower)
 
 def simple_search(query: str) -> list[str]:
-    return [
-        item for item in SEARCH_DATABASE if query.lower() in item.lower()
-    ]
+    return list(_simple_search(query))
 
-def vector_search(query: str) -> list[str]:
+@lru_cache(maxsize=256)
+def _vector_search(query: str) -> tuple[str, ...]:
     # Placeholder for a vector-based search implementation
-    return [
-        item for item in SEARCH_DATABASE if len(item) % 2 == len(query) % 2
-    ]
+    query_parity = len(query) % 2
+    return tuple(
+        item for parity, item in SEARCH_PARITY if parity == query_parity
+    )
+
+def vector_search(query: str) -> list[str]:
+    return list(_vector_search(query))
+
+# Search modes by name, so configs can sweep over plain strings and the
+# experiment resolves the implementation with a single dict lookup
+SEARCH_FNS = {
+    "random": random_search,
+    "simple": simple_search,
+    "vector": vector_search,
+}
 
 # Define some simple ranking components for demonstration purposes
 def noop_rank(results: list[str], k: int) -> list[str]:
     return results[:k]
 
 def length_rank(results: list[str], k: int) -> list[str]:
-    return sorted(results, key=len, reverse=True)[:k]
+    return heapq.nlargest(k, results, key=len)
 
 def alphabetical_rank(results: list[str], k: int) -> list[str]:
-    return sorted(results)[:k]
\ No newline at end of file
+    return heapq.nsmallest(k, results)
\ No newline at end of file
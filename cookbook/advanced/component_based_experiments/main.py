@@ -2,9 +2,7 @@ from spearmint import Spearmint, Config
 from spearmint.configuration import DynamicValue
 
 from _components import (
-    random_search,
-    simple_search,
-    vector_search,
+    SEARCH_FNS,
     noop_rank,
     length_rank,
     alphabetical_rank
@@ -14,7 +12,7 @@ from spearmint.runner import FunctionResult
 # Initialize Spearmint with a single configuration
 mint = Spearmint(configs=[
     {
-        "search_fn": DynamicValue([random_search, simple_search, vector_search]),
+        "search_fn": DynamicValue(list(SEARCH_FNS)),
         "rank_fn": DynamicValue([noop_rank, length_rank, alphabetical_rank]),
         "k": DynamicValue(range(2, 4)),
     }
@@ -22,7 +20,7 @@ mint = Spearmint(configs=[
 
 @mint.experiment()
 def search(query: str, config: Config) -> list[str]:
-    results = config["search_fn"](query)
+    results = SEARCH_FNS[config["search_fn"]](query)
     ranked_results = config["rank_fn"](results, config["k"])
     return ranked_results
 
@@ -47,7 +45,7 @@ if __name__ == "__main__":
         for config in fn_result.experiment_case._configs.values():
             if "search_fn" not in config or "rank_fn" not in config:
                 continue
-            response_eval["search_fn"] = config["search_fn"].__name__
+            response_eval["search_fn"] = SEARCH_FNS[config["search_fn"]].__name__
             response_eval["rank_fn"] = config["rank_fn"].__name__
             response_eval["k"] = config["k"]
             break
@@ -1,11 +1,11 @@
+import sys
+from operator import itemgetter
 from typing import Annotated, Callable
 from spearmint import Spearmint, Config
 from spearmint.configuration import Bind, DynamicValue
 
 from _components import (
-    random_search,
-    simple_search,
-    vector_search,
+    SEARCH_FNS,
     noop_rank,
     length_rank,
     alphabetical_rank
@@ -15,7 +15,7 @@ from spearmint.runner import FunctionResult
 # Initialize Spearmint with a single configuration
 mint = Spearmint(configs=[
     {
-        "search_fn": DynamicValue([random_search, simple_search, vector_search]),
+        "search_fn": DynamicValue(list(SEARCH_FNS)),
         "rank_fn": DynamicValue([noop_rank, length_rank, alphabetical_rank]),
         "k": DynamicValue(range(2, 4)),
     }
@@ -24,11 +24,11 @@ mint = Spearmint(configs=[
 @mint.experiment()
 def search(
     query: str,
-    search_fn: Annotated[Callable, Bind("search_fn")],
+    search_fn: Annotated[str, Bind("search_fn")],
     rank_fn: Annotated[Callable, Bind("rank_fn")],
     k: Annotated[int, Bind("k")]
 ) -> list[str]:
-    results = search_fn(query)
+    results = SEARCH_FNS[search_fn](query)
     ranked_results = rank_fn(results, k)
     return ranked_results
 
@@ -45,33 +45,36 @@ if __name__ == "__main__":
         "All that glitters is not gold",
         "Ask not what your country can do for you; ask what you can do for your country",
     }
+    n_expected = len(expected_search_results)
+    search_fn_names = {name: fn.__name__ for name, fn in SEARCH_FNS.items()}
     evaluations = []
     print(f"Ran {len(all_results)} experiment variants.\n")
     for fn_result in all_results:
         response_eval = {}
         response_eval["result"] = fn_result.result
-        for config in fn_result.experiment_case._configs.values():
-            if "search_fn" not in config or "rank_fn" not in config:
-                continue
-            response_eval["search_fn"] = config["search_fn"].__name__
-            response_eval["rank_fn"] = config["rank_fn"].__name__
-            response_eval["k"] = config["k"]
-            break
+        config_id = fn_result.experiment_case.get_config_id(search.__qualname__)
+        config = fn_result.experiment_case._configs[config_id]
+        response_eval["search_fn"] = search_fn_names[config["search_fn"]]
+        response_eval["rank_fn"] = config["rank_fn"].__name__
+        response_eval["k"] = config["k"]
 
-        precision = len(set(fn_result.result) & expected_search_results) / len(expected_search_results)
-        response_eval["precision"] = precision
-        
-        accuracy = len(set(fn_result.result) & expected_search_results) / len(fn_result.result) if fn_result.result else 0.0
-        response_eval["accuracy"] = accuracy
-
-        f1_score = 2 * (precision * accuracy) / (precision + accuracy) if (precision + accuracy) > 0 else 0.0
-        response_eval["f1_score"] = f1_score
+        # Intersect once and derive all metrics from the hit count.
+        # F1 = 2PA / (P + A) simplifies to 2 * hits / (n_expected + n_returned).
+        hits = len(set(fn_result.result) & expected_search_results)
+        n_returned = len(fn_result.result)
+        response_eval["precision"] = hits / n_expected
+        response_eval["accuracy"] = hits / n_returned if n_returned else 0.0
+        response_eval["f1_score"] = 2 * hits / (n_expected + n_returned) if (n_expected + n_returned) else 0.0
         evaluations.append(response_eval)
 
-    ordered_evaluations = sorted(evaluations, key=lambda x: x["f1_score"], reverse=True)
+    ordered_evaluations = sorted(evaluations, key=itemgetter("f1_score"), reverse=True)
+    # Build the report in memory and emit it with a single write
+    separator = "-" * 40
+    lines = []
     for evaluation in ordered_evaluations:
-        print("Search Function:", evaluation["search_fn"])
-        print(f"Rank Function: {evaluation['rank_fn']}(k={evaluation['k']})")
-        print(f"F1 Score: {evaluation['f1_score']:.2f}, Precision: {evaluation['precision']:.2f}, Accuracy: {evaluation['accuracy']:.2f}")
-        print("Result:", evaluation["result"])
-        print("-" * 40)
\ No newline at end of file
+        lines.append(f"Search Function: {evaluation['search_fn']}")
+        lines.append(f"Rank Function: {evaluation['rank_fn']}(k={evaluation['k']})")
+        lines.append(f"F1 Score: {evaluation['f1_score']:.2f}, Precision: {evaluation['precision']:.2f}, Accuracy: {evaluation['accuracy']:.2f}")
+        lines.append(f"Result: {evaluation['result']}")
+        lines.append(separator)
+    sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
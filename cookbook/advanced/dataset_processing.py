@@ -1,23 +1,49 @@
-import json
+import asyncio
+from collections.abc import Awaitable
 from pathlib import Path
+from typing import Any
 
 from spearmint import Config, Spearmint
+from spearmint.utils.handlers import iter_jsonl
 
 # This recipe demonstrates how to run an experiment over a dataset of inputs.
+# Records are independent, so they are dispatched concurrently and bounded by
+# a semaphore to cap the number of in-flight experiment runs. Repeated inputs
+# share a single run instead of re-executing the experiment.
+
+MAX_CONCURRENCY = 32
 
 mint = Spearmint(configs=[{"id": 0}])
 
 @mint.experiment()
-def process_item(base_str: str, config: Config) -> str:
+async def process_item(base_str: str, config: Config) -> str:
     return f"{base_str}_{config['id']}"
 
-if __name__ == "__main__":
+async def _bounded(semaphore: asyncio.Semaphore, coro: Awaitable[Any]) -> Any:
+    async with semaphore:
+        return await coro
+
+async def main() -> None:
     dataset_path = Path(__file__).parent / "data" / "sample.jsonl"
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
 
-    with Spearmint.run(process_item) as runner:
-        for line in dataset_path.read_text().splitlines():
-            record = json.loads(line)
-            result = runner(record["base_str"])
-            print(f"{result.main_result.result} (expected: {record['expected_output']})")
-            assert result.main_result.result == record["expected_output"]
+    async with Spearmint.arun(process_item) as runner:
+        # Stream records so each run is scheduled as soon as its line is parsed
+        records = []
+        runs: dict[str, asyncio.Future[Any]] = {}
+        for record in iter_jsonl(dataset_path):
+            records.append(record)
+            base_str = record["base_str"]
+            if base_str not in runs:
+                runs[base_str] = asyncio.ensure_future(
+                    _bounded(semaphore, runner(base_str))
+                )
 
+        results = await asyncio.gather(*(runs[record["base_str"]] for record in records))
+
+    for record, result in zip(records, results, strict=True):
+        print(f"{result.main_result.result} (expected: {record['expected_output']})")
+        assert result.main_result.result == record["expected_output"]
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -16,7 +16,7 @@ async def fetch_data(url: str, config: Config) -> str:
     return f"Data from {config['id']}"
 
 async def main():
-    # TODO: rename await_variants to await_variants
+    # Variants run concurrently, so awaiting them takes as long as the slowest one
     async with Spearmint.arun(fetch_data, await_variants=True) as runner:
         results = await runner("http://example.com")
 
@@ -3,6 +3,8 @@ from spearmint.configuration import DynamicValue
 
 # DynamicValue allows you to generate multiple configurations combinatorially
 # using any iterable of values. E.G., lists, ranges, generators, etc.
+# Pass a generator function (not a generator) to get a fresh iterator each time
+# the value is expanded.
 # This is useful for grid search or parameter sweeping.
 
 configs = [
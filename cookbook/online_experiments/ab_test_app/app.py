@@ -1,5 +1,6 @@
+import asyncio
+import hashlib
 import logging
-import time
 
 from fastapi import FastAPI, HTTPException, Request
 from typing import Annotated
@@ -29,9 +30,13 @@ async def add_request_context(request: Request, call_next):
     return response
 
 def sticky_ab_test_config_handler(configs: list[Config], ctx: RuntimeContext) -> tuple[Config, list[Config]]:
-    # hash the user_id to select a config deterministically
+    # hash the user_id to select a config deterministically. Built-in hash() is
+    # salted per process (PYTHONHASHSEED), so use a stable digest to keep users
+    # in the same bucket across workers and restarts.
     user_id = ctx.get("user_id") or "default_user"
-    hashed_id = hash(user_id)
+    hashed_id = int.from_bytes(
+        hashlib.blake2b(user_id.encode("utf-8"), digest_size=8).digest(), "little"
+    )
     index = hashed_id % len(configs)
     logger.info("User ID: %s, Hashed ID: %d, Selected Config Index: %d", user_id, hashed_id, index)
 
@@ -75,7 +80,7 @@ async def summarize_text() -> SummarizeResponse:
     )
     try:
         # model_config: ModelConfig is not passed here. It will be injected by Spearmint
-        summary = _generate_summary(text=request.text, max_length=request.max_length)
+        summary = await _generate_summary(text=request.text, max_length=request.max_length)
         logger.info("Summary generated: %s", summary)
 
         return SummarizeResponse(
@@ -90,7 +95,7 @@ async def summarize_text() -> SummarizeResponse:
 # Dependency inject ModelConfig by binding the values from llm.model_config in the YAML config
 # The main branch will run normally, while the variant branches run in the background
 @mint.experiment()
-def _generate_summary(
+async def _generate_summary(
     text: str,
     model_config: Annotated[ModelConfig, Bind("llm.model_config")],
     max_length: int = 150,
@@ -103,7 +108,9 @@ def _generate_summary(
 
 
     ##### Fake the API call and response #####
-    # response = client.chat.completions.create(
+    # Use an async client so the event loop stays free during the call, e.g.
+    # client = AsyncOpenAI()
+    # response = await client.chat.completions.create(
     #     model=model_config.model,
     #     messages=[
     #         {{ "role": "system", "content": prompt }},
@@ -114,7 +121,7 @@ def _generate_summary(
 
     sleep_time = 0.5
     logger.info("Simulating %s API call with %.2f seconds delay", model_config.model, sleep_time)
-    time.sleep(sleep_time)
+    await asyncio.sleep(sleep_time)
 
     response = f"[fake response] {model_config.model} (temp={model_config.temperature}) {prompt[:20]}..."
     
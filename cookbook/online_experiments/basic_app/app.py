@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import FastAPI, HTTPException
 from typing import Annotated
 from pydantic import BaseModel
@@ -12,6 +14,9 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Use Uvicorn's configured logger so logs show up in the server console.
+logger = logging.getLogger("uvicorn.error")
+
 # Initialize Spearmint with a single configuration
 mint: Spearmint = Spearmint(configs=["cookbook/online_experiments/basic_app/config.yaml"])
 
@@ -77,17 +82,16 @@ def _generate_summary(
     # Fake OpenAI API call
     response = f"fake response {model_config.model} {model_config.temperature} {model_config.prompt[:20]}..."
 
-    print(f"""##### MAKING FAKE API CALL #####
-    response = client.chat.completions.create(
-        model="{model_config.model}",
-        messages=[
-            {{ "role": "system", "content": "{prompt}" }},
-        ],
-        max_tokens={max_tokens},
-        temperature={model_config.temperature},
-    )
-    
-    response[{response}]\n\n""")
+    # Only build the log message when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Fake API call: model=%s max_tokens=%d temperature=%s prompt=%r response=%r",
+            model_config.model,
+            max_tokens,
+            model_config.temperature,
+            prompt,
+            response,
+        )
 
     return response
 
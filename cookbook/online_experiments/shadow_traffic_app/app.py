@@ -1,5 +1,6 @@
+import asyncio
 import logging
-import time
+import os
 
 from fastapi import FastAPI, HTTPException
 from typing import Annotated
@@ -26,6 +27,11 @@ mint: Spearmint = Spearmint(
 # Use Uvicorn's configured logger so logs show up in the server console.
 logger = logging.getLogger("uvicorn.error")
 
+# Simulated API latency in seconds. Set SPEARMINT_FAKE_API_LATENCY_S=0 in tests
+# and benchmarks so the main branch and every shadow variant skip the wait.
+FAKE_API_LATENCY_S = float(os.environ.get("SPEARMINT_FAKE_API_LATENCY_S", "0.5"))
+app.state.fake_latency = FAKE_API_LATENCY_S
+
 class SummarizeRequest(BaseModel):
     text: str
     max_length: int = 150
@@ -54,7 +60,7 @@ async def summarize_text() -> SummarizeResponse:
     )
     try:
         # model_config: ModelConfig is not passed here. It will be injected by Spearmint
-        summary = _generate_summary(text=request.text, max_length=request.max_length)
+        summary = await _generate_summary(text=request.text, max_length=request.max_length)
         logger.info("Summary generated: %s", summary)
 
         return SummarizeResponse(
@@ -68,8 +74,9 @@ async def summarize_text() -> SummarizeResponse:
 
 # Dependency inject ModelConfig by binding the values from llm.model_config in the YAML config
 # The main branch will run normally, while the variant branches run in the background
+# as asyncio tasks, so they overlap with the response instead of blocking the event loop
 @mint.experiment()
-def _generate_summary(
+async def _generate_summary(
     text: str,
     model_config: Annotated[ModelConfig, Bind("llm.model_config")],
     max_length: int = 150,
@@ -91,9 +98,10 @@ def _generate_summary(
     #     temperature=model_config.temperature,
     # )
 
-    sleep_time = 0.5
+    sleep_time = app.state.fake_latency
     logger.info("Simulating %s API call with %.2f seconds delay", model_config.model, sleep_time)
-    time.sleep(sleep_time)
+    if sleep_time > 0:
+        await asyncio.sleep(sleep_time)
 
     response = f"[fake response] {model_config.model} (temp={model_config.temperature}) {prompt[:20]}..."
     
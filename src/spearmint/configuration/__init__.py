@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Callable, Sequence
-from copy import deepcopy
+import logging
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from .config import Config
+from .config import Config, _config_id_from_fragments, _serialize_value
 from .dynamic_value import DynamicValue
 
+logger = logging.getLogger(__name__)
+
+# Checks the shape of a user's base config without building (and hashing) a Config
+_CONFIG_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+
 class Bind:
     """Class to indicate binding of configuration models to function parameters."""
 
@@ -28,16 +34,65 @@ def parse_configs(
     Args:
         *args: Variable number of configuration dictionaries.
     """
-    result = []
+    # Classify in a single pass: inline configs are built immediately, while file
+    # paths are collected and loaded afterwards into their original positions
+    slots: list[list[Config]] = []
+    path_slots: list[tuple[int, str | Path]] = []
     for cfg in configs:
-        if isinstance(cfg, BaseModel):
-            result.append(Config(cfg.model_dump()))
-        elif isinstance(cfg, dict):
-            result.extend(generate_configurations(cfg))
-        elif isinstance(cfg, str) or isinstance(cfg, Path):
-            loaded_configs = config_handler(cfg)
-            result.extend([Config(loaded_cfg) for loaded_cfg in loaded_configs])
-    return result
+        kind = _config_kind(type(cfg))
+        if kind == _MODEL:
+            slots.append([Config(cfg.model_dump())])
+        elif kind == _DICT:
+            slots.append(generate_configurations(cfg))
+        elif kind == _PATH:
+            path_slots.append((len(slots), cfg))
+            slots.append([])
+
+    # Loaded sequentially: warm loads are cache hits, and libyaml holds the GIL,
+    # so a thread pool here only adds start-up cost
+    loaded = [config_handler(path) for _, path in path_slots]
+
+    for (slot, _), loaded_configs in zip(path_slots, loaded, strict=True):
+        slots[slot] = [Config(loaded_cfg) for loaded_cfg in loaded_configs]
+
+    # Overlapping sweeps or repeated sources can yield the same config; drop exact
+    # repeats. Configs that share an explicit config_id but differ are all kept.
+    unique: list[Config] = []
+    seen_roots: dict[str, list[dict[str, Any]]] = {}
+    for slot_configs in slots:
+        for config in slot_configs:
+            roots = seen_roots.setdefault(config["config_id"], [])
+            if config.root in roots:
+                continue
+            if roots:
+                logger.warning(
+                    "Configs with config_id %r have different contents", config["config_id"]
+                )
+            roots.append(config.root)
+            unique.append(config)
+    return unique
+
+
+_MODEL, _DICT, _PATH, _UNSUPPORTED = "model", "dict", "path", "unsupported"
+
+# Config source kind by exact type; subclasses (e.g. PosixPath, user models) are
+# classified with isinstance checks once and then cached here.
+_CONFIG_KINDS: dict[type, str] = {dict: _DICT, str: _PATH}
+
+
+def _config_kind(cfg_type: type) -> str:
+    kind = _CONFIG_KINDS.get(cfg_type)
+    if kind is None:
+        if issubclass(cfg_type, BaseModel):
+            kind = _MODEL
+        elif issubclass(cfg_type, dict):
+            kind = _DICT
+        elif issubclass(cfg_type, (str, Path)):
+            kind = _PATH
+        else:
+            kind = _UNSUPPORTED
+        _CONFIG_KINDS[cfg_type] = kind
+    return kind
 
 
 def generate_configurations(config: dict[str, Any]) -> list[Config]:
@@ -49,6 +104,10 @@ def generate_configurations(config: dict[str, Any]) -> list[Config]:
     Returns:
         List of generated configurations
     """
+    # Validate the user's base config once; the per-combination copies built below
+    # only differ in swept values, so they skip validation
+    _CONFIG_ADAPTER.validate_python(config)
+
     dynamic_value_maps = _find_dynamic_values(config)
     values = []
     configurations = []
@@ -59,9 +118,22 @@ def generate_configurations(config: dict[str, Any]) -> list[Config]:
             [{"keys": dynamic_value_mapping["parent_keys"], "value": val} for val in value_iterable]
         )
 
+    paths = [mapping["parent_keys"] for mapping in dynamic_value_maps]
+
+    # Values outside the swept keys are identical in every variant, so serialize
+    # them once for config ID generation and only re-serialize the swept keys
+    swept_keys = {path[0] for path in paths}
+    static_fragments: dict[str, str] | None = None
+    if "config_id" not in config and all(type(key) is str for key in config):
+        static_fragments = {
+            key: _serialize_value(value) for key, value in config.items() if key not in swept_keys
+        }
+
     # use itertools to generate all combinations of the sweeper values
     for combo in itertools.product(*values):
-        config_copy = deepcopy(config)
+        # Only the dicts on the way to a dynamic value are copied; untouched
+        # subtrees are shared between variants since configs are read-only
+        config_copy = _copy_spine(config, paths)
         for item in combo:
             keys = item["keys"]
             value = item["value"]
@@ -70,14 +142,30 @@ def generate_configurations(config: dict[str, Any]) -> list[Config]:
             for key in keys[:-1]:
                 d = d.setdefault(key, {})
             d[keys[-1]] = value
-        configurations.append(Config(config_copy))
+        if static_fragments is not None:
+            fragments = dict(static_fragments)
+            for key in swept_keys:
+                fragments[key] = _serialize_value(config_copy[key])
+            config_copy["config_id"] = _config_id_from_fragments(fragments)
+        # config_copy only differs from the validated base in swept values
+        configurations.append(Config._from_trusted(config_copy))
 
     return configurations
 
 
-def _find_dynamic_values(
-    config: dict[str, Any], parent_keys: list[str] = []
-) -> list[dict[str, Any]]:
+def _copy_spine(config: dict[str, Any], paths: list[tuple[str, ...]]) -> dict[str, Any]:
+    """Shallow-copy ``config`` and every nested dict along the given key paths."""
+    config_copy = dict(config)
+    nested_paths: dict[str, list[tuple[str, ...]]] = {}
+    for path in paths:
+        if len(path) > 1:
+            nested_paths.setdefault(path[0], []).append(path[1:])
+    for key, sub_paths in nested_paths.items():
+        config_copy[key] = _copy_spine(config_copy[key], sub_paths)
+    return config_copy
+
+
+def _find_dynamic_values(config: dict[str, Any]) -> list[dict[str, Any]]:
     """Find all dynamic_values in the configuration.
 
     Args:
@@ -87,15 +175,19 @@ def _find_dynamic_values(
         List of found dynamic_values
     """
     dynamic_values = []
-    for key, value in config.items():
-        if isinstance(value, DynamicValue):
-            p_keys = parent_keys.copy()
-            p_keys.append(key)
-            dynamic_values.append({"dynamic_value": value, "parent_keys": p_keys})
-        elif isinstance(value, dict):
-            nested_dynamic_values = _find_dynamic_values(value, parent_keys + [key])
-            if nested_dynamic_values:
-                dynamic_values.extend(nested_dynamic_values)
+    # Depth-first walk with an explicit stack of item iterators instead of recursion;
+    # resuming each parent's iterator keeps the same order as a recursive walk
+    stack: list[tuple[Iterator[tuple[str, Any]], tuple[str, ...]]] = [(iter(config.items()), ())]
+    while stack:
+        items, parent_keys = stack[-1]
+        for key, value in items:
+            if isinstance(value, DynamicValue):
+                dynamic_values.append({"dynamic_value": value, "parent_keys": parent_keys + (key,)})
+            elif isinstance(value, dict):
+                stack.append((iter(value.items()), parent_keys + (key,)))
+                break
+        else:
+            stack.pop()
 
     return dynamic_values
 
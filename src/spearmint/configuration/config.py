@@ -8,7 +8,11 @@ from pydantic import RootModel, model_validator
 
 
 class Config(RootModel[dict[str, Any]]):
-    """Configuration model for experiment parameters."""
+    """Configuration model for experiment parameters.
+
+    Parsed configs are shared, not copied, across experiment cases, so treat them
+    as read-only once loaded.
+    """
 
     root: dict[str, Any]
 
@@ -19,6 +23,17 @@ class Config(RootModel[dict[str, Any]]):
             self.root["config_id"] = _generate_config_id(self.root)
         return self
 
+    @classmethod
+    def _from_trusted(cls, root: dict[str, Any]) -> "Config":
+        """Build a config from a dict the framework produced itself, skipping validation.
+
+        Only for internally generated dicts (e.g. sweep expansions); user input goes
+        through the validating constructor.
+        """
+        if "config_id" not in root:
+            root["config_id"] = _generate_config_id(root)
+        return cls.model_construct(root=root)
+
     def __getitem__(self, key: str) -> Any:
         """Enable dict-like access: config['key']."""
         return self.root[key]
@@ -40,6 +55,10 @@ class Config(RootModel[dict[str, Any]]):
         """Enable 'key' in config checks."""
         return key in self.root
 
+    def __hash__(self) -> int:
+        """Hash by config_id so configs can be used as dict keys and set members."""
+        return hash(self.root["config_id"])
+
 
 def _generate_config_id(config: dict[str, Any]) -> str:
     """Generate a unique config ID based on the config and index.
@@ -58,5 +77,27 @@ def _generate_config_id(config: dict[str, Any]) -> str:
     # Exclude config_id from hash calculation to avoid circular dependency
     config_copy = {k: v for k, v in config.items() if k != "config_id"}
     normalized = json.dumps(config_copy, sort_keys=True, default=str)
-    hash_obj = hashlib.sha256(normalized.encode("utf-8"))
-    return hash_obj.hexdigest()[:16]  # Use first 16 chars for brevity
+    return _hash_normalized(normalized)
+
+
+def _serialize_value(value: Any) -> str:
+    """Serialize one top-level config value the way _generate_config_id does."""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _config_id_from_fragments(fragments: dict[str, str]) -> str:
+    """Compute a config ID from pre-serialized top-level values.
+
+    Produces the same ID as ``_generate_config_id`` for a config with string keys,
+    so unchanged values can be serialized once and reused across many configs.
+    """
+    normalized = (
+        "{" + ", ".join(f"{json.dumps(key)}: {fragments[key]}" for key in sorted(fragments)) + "}"
+    )
+    return _hash_normalized(normalized)
+
+
+def _hash_normalized(normalized: str) -> str:
+    # An 8-byte BLAKE2b digest gives the same 16 hex chars without discarding work
+    hash_obj = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8)
+    return hash_obj.hexdigest()
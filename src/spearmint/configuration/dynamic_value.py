@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, Generic, TypeVar
 
 from pydantic._internal._schema_generation_shared import CallbackGetCoreSchemaHandler
@@ -13,13 +13,19 @@ class DynamicValue(Generic[T]):
     This class is used to indicate that a value should be generated at runtime,
     rather than being statically defined in the configuration.
 
+    ``values`` may be an iterable or a zero-argument callable returning one, e.g. a
+    generator function. A callable is invoked on every iteration, so generator-backed
+    values can be expanded more than once without being materialized into a list.
+
     Type Parameters:
         T: The type of the value held by this DynamicValue instance.
     """
 
-    def __init__(self, values: Iterable[T]) -> None:
+    __slots__ = ("values",)
+
+    def __init__(self, values: Iterable[T] | Callable[[], Iterable[T]]) -> None:
         """Initialize a new DynamicValue instance."""
-        self.values: Iterable[T] = values
+        self.values: Iterable[T] | Callable[[], Iterable[T]] = values
 
     def __repr__(self) -> str:
         """Return a string representation of the DynamicValue."""
@@ -27,7 +33,11 @@ class DynamicValue(Generic[T]):
 
     def __iter__(self) -> Iterator[T]:
         """Return an iterator over the values."""
-        return iter(self.values)
+        values = self.values
+        # Some iterables are also callable (e.g. Enum classes); only call factories
+        if callable(values) and not isinstance(values, Iterable):
+            return iter(values())
+        return iter(values)
 
     def __get_pydantic_core_schema__(self, handler: CallbackGetCoreSchemaHandler) -> Any:
         """Pydantic v2 core schema generation hook."""
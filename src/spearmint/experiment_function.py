@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from copy import deepcopy
+from functools import cached_property
 import textwrap
 from typing import Annotated, Any, Union, get_args, get_origin, get_type_hints
 import inspect
@@ -43,23 +43,33 @@ class ExperimentFunction:
     def __init__(
         self,
         func: Callable[..., Any],
-        configs: list[Config] = [],
+        configs: list[Config] | Callable[[], list[Config]] = [],
         config_handler: Callable[[list[Config], RuntimeContext], tuple[Config, list[Config]]] | None = None,
     ) -> None:
         self.func = func
         self.name = func.__qualname__
         self.short_name = func.__name__
         self.config_handler = config_handler or default_config_handler
-        self.registered_configs = configs
+        self._config_source = configs
+        self.parameters: list[inspect.Parameter] = list(inspect.signature(func).parameters.values())
         self.param_bindings = self._param_bindings()
-        self.assigned_configs = self.bind_configs()
         self.inner_calls: dict[str, ExperimentFunction | None] = self._inner_calls()
 
+    @cached_property
+    def registered_configs(self) -> list[Config]:
+        """Configs for this experiment, resolved from a loader on first access."""
+        source = self._config_source
+        return source() if callable(source) else source
+
+    @cached_property
+    def assigned_configs(self) -> dict[str, dict[str, BaseModel]]:
+        return self.bind_configs()
+
     def __call__(self, experiment_case: ExperimentCase, *args: Any, **kwargs: Any) -> Any:
         config_id = experiment_case.get_config_id(self.name)
         assigned_configs = self.assigned_configs.get(config_id, {})
         injected_args, injected_kwargs = self.inject_config(
-            self.func, assigned_configs, *args, **kwargs
+            self.parameters, assigned_configs, *args, **kwargs
         )
 
         return self.func(*injected_args, **injected_kwargs)
@@ -167,13 +177,15 @@ class ExperimentFunction:
         return bound_configs_by_id
     
     def bind_config(self, config: Config) -> dict[str, BaseModel]:
-        bound_configs = {}
+        bound_configs: dict[str, BaseModel] = {}
+        if not self.param_bindings:
+            return bound_configs
 
         for param_name, param_bind in self.param_bindings.items():
             for model_cls, bind_path in param_bind.items(): 
-                # For RootModel, model_dump() returns the root dict
-                config_dict = config.model_dump() if hasattr(config, "model_dump") else config.root
-                config_data = deepcopy(config_dict)
+                # For RootModel, model_dump() returns the root dict. It already builds
+                # fresh containers, so each parameter gets its own data without a deepcopy.
+                config_data = config.model_dump() if hasattr(config, "model_dump") else config.root
                 parts = bind_path.split(".")
                 for part in parts:
                     if not part:
@@ -193,12 +205,9 @@ class ExperimentFunction:
 
 
     def inject_config(self,
-        func: Callable[..., Any], configs: dict[str, BaseModel], *args: Any, **kwargs: Any
+        params_list: list[inspect.Parameter], configs: dict[str, BaseModel], *args: Any, **kwargs: Any
     ) -> tuple[tuple[Any, ...], dict[str, Any]]:
-        inspect_signature = inspect.signature(func)
-
         # Track which parameters have been filled by positional arguments
-        params_list = list(inspect_signature.parameters.values())
         filled_params = set()
 
         if not params_list:
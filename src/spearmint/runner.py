@@ -6,9 +6,10 @@ import asyncio
 import contextvars
 import inspect
 import logging
+import os
 import threading
 from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
 from typing import Any
@@ -19,6 +20,35 @@ from .registry import experiment_fn_registry
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for awaited sync variants. Variant threads reuse the active runner,
+# so they never fan out again and cannot deadlock waiting on this pool.
+_variant_executor: ThreadPoolExecutor | None = None
+_variant_executor_lock = threading.Lock()
+
+# Overrides the pool size; defaults to min(32, cpu_count + 4) like ThreadPoolExecutor
+_THREAD_POOL_SIZE_ENV = "SPEARMINT_THREAD_POOL_SIZE"
+
+
+def _thread_pool_size() -> int | None:
+    value = os.environ.get(_THREAD_POOL_SIZE_ENV)
+    if not value:
+        return None
+    size = int(value)
+    if size < 1:
+        raise ValueError(f"{_THREAD_POOL_SIZE_ENV} must be a positive integer, got {value!r}")
+    return size
+
+
+def _get_variant_executor() -> ThreadPoolExecutor:
+    global _variant_executor
+    if _variant_executor is None:
+        with _variant_executor_lock:
+            if _variant_executor is None:
+                _variant_executor = ThreadPoolExecutor(
+                    max_workers=_thread_pool_size(), thread_name_prefix="spearmint-variant"
+                )
+    return _variant_executor
+
 
 @dataclass
 class FunctionResult:
@@ -32,16 +62,101 @@ class ExperimentCaseResults:
     variant_results: list[FunctionResult]
 
 
-def _run_coroutine_sync(coro: Awaitable[Any]) -> Any:
+class _ThreadLoop:
+    """Event loop reused by every sync-to-async call made from one thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self) -> None:
+        # Runs when the owning thread exits and its thread-local state is cleared.
+        # Async generators are only shut down here: shutdown_asyncgens() stops the
+        # loop from tracking new generators, so it must not run between calls.
+        if not self.loop.is_closed():
+            try:
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+
+
+_thread_loops = threading.local()
+
+
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    holder: _ThreadLoop | None = getattr(_thread_loops, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _ThreadLoop()
+        _thread_loops.holder = holder
+    return holder.loop
+
+
+# Runs coroutines for sync callers that are already inside an event loop. Workers
+# keep their thread loop between calls instead of starting one per call.
+_bridge_executor: ThreadPoolExecutor | None = None
+_bridge_executor_lock = threading.Lock()
+
+
+def _mark_bridge_thread() -> None:
+    _thread_loops.is_bridge = True
+
+
+def _get_bridge_executor() -> ThreadPoolExecutor:
+    global _bridge_executor
+    if _bridge_executor is None:
+        with _bridge_executor_lock:
+            if _bridge_executor is None:
+                _bridge_executor = ThreadPoolExecutor(
+                    max_workers=_thread_pool_size(),
+                    thread_name_prefix="spearmint-bridge",
+                    initializer=_mark_bridge_thread,
+                )
+    return _bridge_executor
+
+
+def _run_on_thread_loop(coro: Awaitable[Any]) -> Any:
+    loop = _get_thread_loop()
     try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        # When there's no running loop, we can safely use asyncio.run
-        # Note: asyncio.run expects a Coroutine, but in practice exp() will
-        # return a coroutine when the function is async def.
-        return asyncio.run(coro)  # type: ignore[arg-type]
+        return loop.run_until_complete(coro)
+    finally:
+        # Cancel tasks left behind like asyncio.run does, so they cannot resume
+        # inside a later, unrelated call on this loop
+        _cancel_pending_tasks(loop)
+
+
+def _cancel_pending_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    for task in pending:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception during spearmint sync call shutdown",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+
+def _run_coroutine_sync(coro: Awaitable[Any]) -> Any:
+    # _get_running_loop() returns None instead of raising, which keeps exception
+    # handling off the per-call path
+    if asyncio._get_running_loop() is None:
+        # When there's no running loop, drive the coroutine on this thread's
+        # reusable loop instead of creating and tearing one down per call as
+        # asyncio.run would. run_until_complete copies the current context, so
+        # experiment context variables are visible to the coroutine.
+        return _run_on_thread_loop(coro)
 
     ctx = contextvars.copy_context()
+    if not getattr(_thread_loops, "is_bridge", False):
+        return _get_bridge_executor().submit(ctx.run, _run_on_thread_loop, coro).result()
+
+    # Nested call from a bridge worker: waiting on the shared pool from inside it
+    # could exhaust the pool and deadlock, so use a dedicated thread instead
     with ThreadPoolExecutor(max_workers=1) as executor:
         future: Any = executor.submit(ctx.run, asyncio.run, coro)  # type: ignore[arg-type]
         return future.result()
@@ -52,13 +167,13 @@ class ExperimentRunner:
         self.entry_point_fn: ExperimentFunction = entry_point_fn
         self.await_variants: bool = await_variants
 
-    def _handle_background_task_exception(self, task: asyncio.Task[Any]) -> None:
-        """Handle exceptions from background variant tasks."""
+    def _handle_background_task_exception(self, task: asyncio.Task[Any] | Future[Any]) -> None:
+        """Handle exceptions from background variant tasks or pool futures."""
+        if task.cancelled():
+            # Task was cancelled, which is a normal control flow mechanism
+            return
         try:
             task.result()
-        except asyncio.CancelledError:
-            # Task was cancelled, which is a normal control flow mechanism
-            pass
         except Exception:
             logger.exception(
                 "Exception in background variant task for experiment '%s'",
@@ -67,53 +182,74 @@ class ExperimentRunner:
 
     def start(self, *args: Any, **kwargs: Any) -> ExperimentCaseResults:
         main_case, variant_cases = self.entry_point_fn.get_experiment_cases()
-        with set_experiment_case(main_case):
-            main = self.run_with_context(self.entry_point_fn)(*args, **kwargs)
 
-        variant_results: list[FunctionResult] = []
-        if variant_cases:
-            if self.await_variants:
-                with ThreadPoolExecutor() as executor:
-                    futures = []
-                    for variant_case in variant_cases:
-                        ctx = contextvars.copy_context()
-                        futures.append(
-                            executor.submit(
-                                ctx.run, self._run_variant_sync, variant_case, *args, **kwargs
-                            )
-                        )
-                    for future in futures:
-                        variant_results.append(future.result())
-            else:
-                for variant_case in variant_cases:
-                    ctx = contextvars.copy_context()
-                    thread = threading.Thread(
-                        target=ctx.run,
-                        args=(self._run_variant_sync, variant_case, *args),
-                        kwargs=kwargs,
-                        daemon=True,
-                    )
-                    thread.start()
+        # Awaited variants are submitted before the main case so they overlap with it
+        futures: list[Future[FunctionResult]] = []
+        if variant_cases and self.await_variants:
+            executor = _get_variant_executor()
+            for variant_case in variant_cases:
+                ctx = contextvars.copy_context()
+                futures.append(
+                    executor.submit(ctx.run, self._run_variant_sync, variant_case, *args, **kwargs)
+                )
+
+        try:
+            with set_experiment_case(main_case):
+                main = self.run_with_context(self.entry_point_fn)(*args, **kwargs)
+        except BaseException:
+            # Nobody will collect variant results once the main case fails; queued
+            # variants are dropped and running ones only get their errors logged
+            for future in futures:
+                future.cancel()
+                future.add_done_callback(self._handle_background_task_exception)
+            raise
+
+        variant_results: list[FunctionResult] = [future.result() for future in futures]
+        if variant_cases and not self.await_variants:
+            for variant_case in variant_cases:
+                ctx = contextvars.copy_context()
+                thread = threading.Thread(
+                    target=ctx.run,
+                    args=(self._run_variant_sync, variant_case, *args),
+                    kwargs=kwargs,
+                    daemon=True,
+                )
+                thread.start()
 
         return ExperimentCaseResults(main_result=main.main_result, variant_results=variant_results)
 
     async def start_async(self, *args: Any, **kwargs: Any) -> ExperimentCaseResults:
         main_case, variant_cases = self.entry_point_fn.get_experiment_cases()
-        with set_experiment_case(main_case):
-            main = await self.run_with_context_async(self.entry_point_fn)(*args, **kwargs)
+
+        # Awaited variants start before the main case so they overlap with it
+        awaited_tasks: list[asyncio.Task[FunctionResult]] = []
+        if variant_cases and self.await_variants:
+            awaited_tasks = [
+                asyncio.create_task(self._run_variant_async(variant_case, *args, **kwargs))
+                for variant_case in variant_cases
+            ]
+
+        try:
+            with set_experiment_case(main_case):
+                main = await self.run_with_context_async(self.entry_point_fn)(*args, **kwargs)
+        except BaseException:
+            # Nobody will collect variant results once the main case fails
+            for task in awaited_tasks:
+                task.cancel()
+                task.add_done_callback(self._handle_background_task_exception)
+            raise
 
         variant_results: list[FunctionResult] = []
-        if variant_cases:
+        if awaited_tasks:
+            variant_results = await asyncio.gather(*awaited_tasks)
+        elif variant_cases:
             tasks = [
                 asyncio.create_task(self._run_variant_async(variant_case, *args, **kwargs))
                 for variant_case in variant_cases
             ]
-            if self.await_variants:
-                variant_results = await asyncio.gather(*tasks)
-            else:
-                # Add done callbacks to handle exceptions in background tasks
-                for task in tasks:
-                    task.add_done_callback(self._handle_background_task_exception)
+            # Add done callbacks to handle exceptions in background tasks
+            for task in tasks:
+                task.add_done_callback(self._handle_background_task_exception)
 
         return ExperimentCaseResults(main_result=main.main_result, variant_results=variant_results)
 
@@ -168,12 +304,20 @@ class ExperimentRunner:
             return result.main_result
 
 
+def _resolve_experiment(func: Callable[..., Any] | ExperimentFunction) -> ExperimentFunction:
+    # Decorator wrappers pass their ExperimentFunction directly, skipping the
+    # unwrap and registry lookup on every call
+    if isinstance(func, ExperimentFunction):
+        return func
+    return experiment_fn_registry.get_experiment(func)
+
+
 @contextmanager
 def run_experiment(
-    func: Callable[..., Any], await_variants: bool = False
+    func: Callable[..., Any] | ExperimentFunction, await_variants: bool = False
 ) -> Iterator[Callable[..., ExperimentCaseResults]]:
     """Run the given function as a sync experiment."""
-    experiment_fn = experiment_fn_registry.get_experiment(func)
+    experiment_fn = _resolve_experiment(func)
 
     runner = experiment_runner.get()
     if not runner:
@@ -191,10 +335,10 @@ def run_experiment(
 
 @asynccontextmanager
 async def run_experiment_async(
-    func: Callable[..., Any], await_variants: bool = False
+    func: Callable[..., Any] | ExperimentFunction, await_variants: bool = False
 ) -> AsyncIterator[Callable[..., Coroutine[Any, Any, ExperimentCaseResults]]]:
     """Run the given function as an async experiment."""
-    experiment_fn = experiment_fn_registry.get_experiment(func)
+    experiment_fn = _resolve_experiment(func)
 
     runner = experiment_runner.get()
     if not runner:
@@ -9,7 +9,7 @@ import asyncio
 import inspect
 from contextlib import asynccontextmanager, contextmanager
 from collections.abc import Callable, Sequence
-from functools import wraps
+from functools import cached_property, wraps
 from pathlib import Path
 from typing import Any, ParamSpec, TypeVar, cast
 
@@ -31,7 +31,12 @@ class Spearmint:
         configs: Sequence[dict[str, Any] | Config | str | Path] | None = None,
     ) -> None:
         self.branch_strategy: Callable[..., tuple[Config, list[Config]]] | None = branch_strategy
-        self.configs: list[Config] = parse_configs(configs or [], yaml_handler)
+        self._config_sources: list[dict[str, Any] | Config | str | Path] = list(configs or [])
+
+    @cached_property
+    def configs(self) -> list[Config]:
+        """Parsed configurations, loaded from their sources on first access."""
+        return parse_configs(self._config_sources, yaml_handler)
 
     def experiment(
         self,
@@ -40,21 +45,28 @@ class Spearmint:
     ) -> Callable[[Callable[..., T]], Callable[..., T]]:
         """Decorator for wrapping functions with experiment execution strategy."""
         branch_strategy = branch_strategy or self.branch_strategy
-        parsed_configs = parse_configs(configs or self.configs or [], yaml_handler)
+
+        def load_configs() -> list[Config]:
+            # Deferred until the experiment first needs its configs so importing a
+            # module that declares experiments does not parse YAML files.
+            if not configs:
+                # Instance configs are already parsed; reuse them instead of re-expanding
+                return list(self.configs)
+            return parse_configs(configs, yaml_handler)
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            experiment = ExperimentFunction(func=func, configs=parsed_configs, config_handler=branch_strategy)
+            experiment = ExperimentFunction(func=func, configs=load_configs, config_handler=branch_strategy)
             experiment_fn_registry.register_experiment(experiment)
 
             @wraps(func)
             def swrapper(*args: Any, **kwargs: Any) -> T:
-                with run_experiment(func) as runner:
+                with run_experiment(experiment) as runner:
                     results = runner(*args, **kwargs)
                     return cast(T, results.main_result.result)
 
             @wraps(func)
             async def awrapper(*args: Any, **kwargs: Any) -> T:
-                async with run_experiment_async(func) as runner:
+                async with run_experiment_async(experiment) as runner:
                     results = await runner(*args, **kwargs)
                     return cast(T, results.main_result.result)
 
@@ -72,7 +84,11 @@ class Spearmint:
     @staticmethod
     @asynccontextmanager
     async def arun(func: Callable[..., Any], await_variants: bool = False):
-        """Run the given function as an async experiment."""
+        """Run the given function as an async experiment.
+
+        Variants are scheduled as concurrent tasks, so with ``await_variants=True``
+        the wait is bounded by the slowest variant rather than their sum.
+        """
         async with run_experiment_async(
             func, await_variants=await_variants
         ) as runner:
@@ -1,9 +1,30 @@
 import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    # libyaml-backed loader; PyYAML builds without libyaml only ship the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+_YAML_CACHE_MAX_ENTRIES = 100
+_CACHE_MISS = object()
+
+# Opt-in: persist parsed YAML as a ``<file>.json`` sidecar and prefer it while it is fresh
+_JSON_SIDECAR_ENV = "SPEARMINT_YAML_JSON_CACHE"
+
+# Parsed YAML documents keyed by absolute path, validated against (mtime_ns, size)
+_yaml_cache: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
 
 def jsonl_handler(file_path: str | Path) -> list[dict[str, Any]]:
     """
@@ -16,8 +37,25 @@ def jsonl_handler(file_path: str | Path) -> list[dict[str, Any]]:
         A list of dictionaries representing the JSON Lines data.
     """
 
-    with open(file_path, "r") as f:
-        return [json.loads(line) for line in f]
+    return list(iter_jsonl(file_path))
+
+
+def iter_jsonl(file_path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Lazily read a JSON Lines file one record at a time.
+
+    Blank lines are skipped, so rows can be processed before the whole file is read.
+
+    Args:
+        file_path: Path to the JSON Lines file.
+
+    Returns:
+        An iterator of dictionaries, one per non-empty line.
+    """
+    with open(file_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
 
 
 def yaml_handler(file_path: str | Path) -> list[dict[str, Any]]:
@@ -30,25 +68,127 @@ def yaml_handler(file_path: str | Path) -> list[dict[str, Any]]:
     Returns:
         A dictionary representing the YAML data.
     """
-    path_obj = Path(file_path)
+    keys = [os.path.abspath(yaml_file) for yaml_file in _yaml_files(file_path)]
+    stats = [os.stat(key) for key in keys]
+    results = [_cached_yaml(key, stat) for key, stat in zip(keys, stats, strict=True)]
 
-    if not path_obj.exists():
-        raise FileNotFoundError(f"Configuration path does not exist: {file_path}")
+    # Cache hits are served directly. Misses are parsed inline: libyaml holds the
+    # GIL, so a thread pool would only slow cold loads down.
+    for i, data in enumerate(results):
+        if data is _CACHE_MISS:
+            results[i] = _parse_yaml_file(keys[i], stats[i])
+    return results
 
-    configs: list[dict[str, Any]] = []
 
-    if path_obj.is_file():
-        configs.append(_load_yaml_file(path_obj))
-    elif path_obj.is_dir():
-        # Load all YAML files in directory (recursively)
-        for yaml_file in sorted(path_obj.rglob("*.yaml")) + sorted(
-            path_obj.rglob("*.yml")
-        ):
-            configs.append(_load_yaml_file(yaml_file))
+def compile_yaml_sidecars(file_path: str | Path) -> list[Path]:
+    """
+    Pre-build the JSON sidecar for each YAML config, e.g. as a packaging step.
 
-    return configs
+    The sidecars are read instead of the YAML files when ``SPEARMINT_YAML_JSON_CACHE=1``.
 
+    Args:
+        file_path: Path to a YAML file or a directory of YAML files.
+
+    Returns:
+        Paths of the sidecar files that were written.
+    """
+    written: list[Path] = []
+    for yaml_file in _yaml_files(file_path):
+        with open(yaml_file, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        sidecar_path = Path(f"{yaml_file}.json")
+        if _write_json_sidecar(str(sidecar_path), data):
+            written.append(sidecar_path)
+    return written
 
-def _load_yaml_file(file_path: Path) -> dict[str, Any]:
-    with open(file_path, "r") as f:
-        return yaml.safe_load(f)
+
+def _yaml_files(file_path: str | Path) -> list[Path]:
+    path_obj = Path(file_path)
+
+    if not path_obj.exists():
+        raise FileNotFoundError(f"Configuration path does not exist: {file_path}")
+
+    if path_obj.is_file():
+        return [path_obj]
+    if path_obj.is_dir():
+        # Load all YAML files in directory (recursively), walking the tree once for
+        # both extensions; .yaml files still come before .yml files
+        yaml_files: list[Path] = []
+        yml_files: list[Path] = []
+        for dirpath, _, filenames in os.walk(path_obj):
+            for filename in filenames:
+                if filename.endswith(".yaml"):
+                    yaml_files.append(Path(dirpath, filename))
+                elif filename.endswith(".yml"):
+                    yml_files.append(Path(dirpath, filename))
+        return sorted(yaml_files) + sorted(yml_files)
+    return []
+
+
+def _cached_yaml(key: str, stat: os.stat_result) -> Any:
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is None or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size:
+            return _CACHE_MISS
+        _yaml_cache.move_to_end(key)
+    # Callers may mutate the returned config, so never hand out the cached object
+    return deepcopy(cached[2])
+
+
+def _parse_yaml_file(key: str, stat: os.stat_result) -> Any:
+    data = _read_yaml_file(key, stat)
+
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _yaml_cache.move_to_end(key)
+        if len(_yaml_cache) > _YAML_CACHE_MAX_ENTRIES:
+            _yaml_cache.popitem(last=False)
+    return deepcopy(data)
+
+
+def _read_yaml_file(file_path: str, stat: os.stat_result) -> Any:
+    if file_path.endswith(".json"):
+        # JSON is a subset of YAML, so the json parser gives the same result much faster
+        with open(file_path, "rb") as f:
+            return json.load(f)
+
+    use_sidecar = os.environ.get(_JSON_SIDECAR_ENV) == "1"
+    sidecar_path = file_path + ".json"
+
+    if use_sidecar:
+        try:
+            if os.stat(sidecar_path).st_mtime_ns >= stat.st_mtime_ns:
+                with open(sidecar_path, "rb") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    with open(file_path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    if use_sidecar:
+        _write_json_sidecar(sidecar_path, data)
+    return data
+
+
+def _write_json_sidecar(sidecar_path: str, data: Any) -> bool:
+    try:
+        serialized = json.dumps(data, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return False
+    # Skip documents JSON cannot represent faithfully (e.g. non-string keys)
+    if json.loads(serialized) != data:
+        return False
+
+    tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(serialized)
+        os.replace(tmp_path, sidecar_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
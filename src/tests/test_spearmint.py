@@ -1,17 +1,23 @@
 import asyncio
+import json
 import runpy
 import sys
 import threading
+import warnings
+from collections.abc import AsyncIterator, Iterable, Iterator
+from enum import Enum
 from pathlib import Path
-from typing import Annotated, Iterable
+from typing import Annotated, Any
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from spearmint import Config, Spearmint, experiment
-from spearmint.configuration import Bind
+from spearmint.configuration import Bind, DynamicValue, generate_configurations, parse_configs
 from spearmint.context import current_experiment_case
 from spearmint.registry import experiment_fn_registry
+from spearmint.runner import _thread_pool_size
+from spearmint.utils.handlers import compile_yaml_sidecars, yaml_handler
 
 
 class TestSpearmint:
@@ -101,6 +107,32 @@ class TestSpearmint:
             in variant_values
         )
 
+    def test_bound_model_validated_once_per_config(self):
+        class ModelConfig(BaseModel):
+            model_name: str
+
+        seen: list[ModelConfig] = []
+
+        @experiment(configs=[{"model_name": "gpt-4"}])
+        def generate(prompt: str, model_config: ModelConfig) -> str:
+            seen.append(model_config)
+            return f"{prompt}:{model_config.model_name}"
+
+        assert generate("a") == "a:gpt-4"
+        assert generate("b") == "b:gpt-4"
+        assert seen[0] is seen[1]
+
+    def test_bindings_to_same_path_do_not_share_data(self):
+        class Llm(BaseModel):
+            params: Any
+
+        @experiment(configs=[{"llm": {"params": {"temperature": 1}}}])
+        def generate(a: Annotated[Llm, Bind("llm")], b: Annotated[Llm, Bind("llm")]) -> int:
+            a.params["temperature"] = 99
+            return b.params["temperature"]
+
+        assert generate() == 1
+
     def test_nested_experiments_multiple_configs(self):
         inner_configs = [
             {"id": "inner_a"},
@@ -189,6 +221,56 @@ class TestSpearmint:
         assert done.wait(timeout=1.0)
         assert set(seen) == {"main", "variant_a", "variant_b"}
 
+    def test_awaited_variants_overlap_main(self):
+        configs = [{"id": "main"}, {"id": "variant"}]
+        variant_started = threading.Event()
+
+        @experiment(configs=configs)
+        def process(value: str, config: Config) -> str:
+            if config["id"] == "variant":
+                variant_started.set()
+            else:
+                # Only succeeds if the variant runs while the main case is in flight
+                assert variant_started.wait(timeout=1.0)
+            return f"{value}_{config['id']}"
+
+        with Spearmint.run(process, await_variants=True) as runner:
+            results = runner("test")
+
+        assert results.main_result.result == "test_main"
+        assert [r.result for r in results.variant_results] == ["test_variant"]
+
+    def test_main_failure_cancels_queued_variants(self, monkeypatch, caplog):
+        from concurrent.futures import ThreadPoolExecutor
+
+        import spearmint.runner as runner_module
+
+        # A single worker keeps every variant after the first one queued
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(runner_module, "_variant_executor", executor)
+        started = threading.Event()
+        release = threading.Event()
+        ran: list[str] = []
+
+        @experiment(configs=[{"id": "main"}, {"id": "v1"}, {"id": "v2"}, {"id": "v3"}])
+        def process(config: Config) -> str:
+            if config["id"] == "main":
+                assert started.wait(timeout=1.0)
+                raise ValueError("main failed")
+            ran.append(config["id"])
+            started.set()
+            release.wait(timeout=1.0)
+            raise RuntimeError("variant failed")
+
+        with pytest.raises(ValueError):
+            with Spearmint.run(process, await_variants=True) as runner:
+                runner()
+
+        release.set()
+        executor.shutdown(wait=True)
+        assert ran == ["v1"]
+        assert "Exception in background variant task" in caplog.text
+
     def test_async_experiment_from_sync(self):
         configs = [{"id": "async"}]
 
@@ -203,6 +285,52 @@ class TestSpearmint:
         assert results.main_result.result == "test_async"
         assert results.variant_results == []
 
+    def test_async_experiment_from_sync_cancels_leftover_tasks(self):
+        leftover: list[asyncio.Task[None]] = []
+
+        @experiment(configs=[{"id": "async"}])
+        async def process(value: str, config: Config) -> str:
+            leftover.append(asyncio.create_task(asyncio.sleep(3600)))
+            return f"{value}_{config['id']}"
+
+        with Spearmint.run(process) as runner:
+            results = runner("test")
+
+        assert results.main_result.result == "test_async"
+        assert leftover[0].cancelled()
+
+    def test_async_experiment_from_sync_reuses_loop_with_async_generators(self):
+        async def numbers() -> AsyncIterator[int]:
+            for number in range(3):
+                yield number
+
+        @experiment(configs=[{"id": "async"}])
+        async def process(value: str, config: Config) -> str:
+            total = 0
+            async for number in numbers():
+                total += number
+            return f"{value}_{total}"
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for _ in range(3):
+                with Spearmint.run(process) as runner:
+                    assert runner("test").main_result.result == "test_3"
+
+    @pytest.mark.asyncio
+    async def test_async_experiment_from_sync_inside_running_loop(self):
+        configs = [{"id": "async"}]
+
+        @experiment(configs=configs)
+        async def process(value: str, config: Config) -> str:
+            await asyncio.sleep(0.01)
+            return f"{value}_{config['id']}"
+
+        for value in ("first", "second"):
+            with Spearmint.run(process) as runner:
+                results = runner(value)
+            assert results.main_result.result == f"{value}_async"
+
     @pytest.mark.asyncio
     async def test_async_experiment(self):
         configs = [{"id": "async"}]
@@ -221,6 +349,101 @@ class TestSpearmint:
         assert results.main_result.result == "test_async"
         assert results.variant_results == []
 
+    @pytest.mark.asyncio
+    async def test_async_variants_run_concurrently(self):
+        configs = [
+            {"id": "main"},
+            {"id": "variant_a"},
+            {"id": "variant_b"},
+        ]
+        started = {"variant_a": asyncio.Event(), "variant_b": asyncio.Event()}
+
+        @experiment(configs=configs)
+        async def process(value: str, config: Config) -> str:
+            if config["id"] in started:
+                # Each variant waits for the other to start, which only
+                # completes if both are in flight at the same time.
+                started[config["id"]].set()
+                await asyncio.gather(*(event.wait() for event in started.values()))
+            return f"{value}_{config['id']}"
+
+        async with Spearmint.arun(process, await_variants=True) as runner:
+            results = await asyncio.wait_for(runner("test"), timeout=1.0)
+
+        assert results.main_result.result == "test_main"
+        assert {r.result for r in results.variant_results} == {"test_variant_a", "test_variant_b"}
+
+    @pytest.mark.asyncio
+    async def test_async_awaited_variants_overlap_main(self):
+        variant_started = asyncio.Event()
+
+        @experiment(configs=[{"id": "main"}, {"id": "variant"}])
+        async def process(value: str, config: Config) -> str:
+            if config["id"] == "variant":
+                variant_started.set()
+            else:
+                # Only completes if the variant runs while the main case is in flight
+                await variant_started.wait()
+            return f"{value}_{config['id']}"
+
+        async with Spearmint.arun(process, await_variants=True) as runner:
+            results = await asyncio.wait_for(runner("test"), timeout=1.0)
+
+        assert results.main_result.result == "test_main"
+        assert [r.result for r in results.variant_results] == ["test_variant"]
+
+    @pytest.mark.asyncio
+    async def test_async_main_failure_cancels_awaited_variants(self):
+        variant_finished = False
+
+        @experiment(configs=[{"id": "main"}, {"id": "variant"}])
+        async def process(config: Config) -> str:
+            nonlocal variant_finished
+            if config["id"] == "main":
+                raise ValueError("main failed")
+            await asyncio.sleep(0.05)
+            variant_finished = True
+            return "variant"
+
+        with pytest.raises(ValueError):
+            async with Spearmint.arun(process, await_variants=True) as runner:
+                await runner()
+
+        await asyncio.sleep(0.1)
+        assert not variant_finished
+
+    @pytest.mark.asyncio
+    async def test_async_runner_calls_run_concurrently(self):
+        configs = [{"id": "a"}, {"id": "b"}]
+        inputs = [f"row{i}" for i in range(5)]
+        in_flight: set[str] = set()
+        all_started = asyncio.Event()
+
+        @experiment(configs=configs)
+        async def process(value: str, config: Config) -> str:
+            if config["id"] == "a":
+                in_flight.add(value)
+                if len(in_flight) == len(inputs):
+                    all_started.set()
+                await all_started.wait()
+            return f"{value}_{config['id']}"
+
+        semaphore = asyncio.Semaphore(len(inputs))
+
+        async def bounded(value: str):
+            async with semaphore:
+                return await runner(value)
+
+        async with Spearmint.arun(process, await_variants=True) as runner:
+            results = await asyncio.wait_for(
+                asyncio.gather(*(bounded(value) for value in inputs)), timeout=1.0
+            )
+
+        assert [r.main_result.result for r in results] == [f"{v}_a" for v in inputs]
+        assert [[v.result for v in r.variant_results] for r in results] == [
+            [f"{v}_b"] for v in inputs
+        ]
+
     @pytest.mark.asyncio
     async def test_async_background_variant_exception_handling(self):
         """Test that exceptions in async background variants don't cause unobserved task warnings."""
@@ -255,6 +478,164 @@ class TestSpearmint:
         # the exception handling is working correctly
 
 
+def test_dynamic_value_generator_factory_is_reiterable() -> None:
+    def generate_ids() -> Iterator[int]:
+        yield from range(3)
+
+    dynamic_value = DynamicValue(generate_ids)
+    assert list(dynamic_value) == [0, 1, 2]
+    assert list(dynamic_value) == [0, 1, 2]
+
+    configs = generate_configurations({"id": dynamic_value})
+    assert [config["id"] for config in configs] == [0, 1, 2]
+
+
+def test_dynamic_value_expands_enum_members() -> None:
+    class Color(Enum):
+        RED = "red"
+        BLUE = "blue"
+
+    configs = generate_configurations({"color": DynamicValue(Color)})
+    assert [config["color"] for config in configs] == [Color.RED, Color.BLUE]
+
+
+def test_generate_configurations_copies_only_swept_paths() -> None:
+    shared = {"prompt": "hi"}
+    source = {"llm": {"model": DynamicValue(["a", "b"]), "extra": shared}, "static": shared}
+
+    first, second = generate_configurations(source)
+
+    assert (first["llm"]["model"], second["llm"]["model"]) == ("a", "b")
+    assert isinstance(source["llm"]["model"], DynamicValue)
+    assert first["llm"]["extra"] is second["static"] is shared
+
+
+def test_generated_config_ids_match_parsed_configs() -> None:
+    generated = generate_configurations({"llm": {"model": DynamicValue(["a", "b"])}, "n": 1})
+
+    assert [config["config_id"] for config in generated] == [
+        Config({"llm": {"model": model}, "n": 1})["config_id"] for model in ("a", "b")
+    ]
+
+
+def test_inline_configs_with_non_str_keys_are_rejected() -> None:
+    with pytest.raises(ValidationError):
+        generate_configurations({1: "a"})
+    with pytest.raises(ValidationError):
+        parse_configs([{1: "a", "m": DynamicValue(["x", "y"])}], yaml_handler)
+
+
+def test_config_hashable_by_config_id() -> None:
+    first, duplicate, other = Config({"id": 1}), Config({"id": 1}), Config({"id": 2})
+
+    assert hash(first) == hash(first["config_id"])
+    assert {first, duplicate, other} == {first, other}
+
+
+def test_thread_pool_size_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SPEARMINT_THREAD_POOL_SIZE", raising=False)
+    assert _thread_pool_size() is None
+
+    monkeypatch.setenv("SPEARMINT_THREAD_POOL_SIZE", "4")
+    assert _thread_pool_size() == 4
+
+    monkeypatch.setenv("SPEARMINT_THREAD_POOL_SIZE", "0")
+    with pytest.raises(ValueError):
+        _thread_pool_size()
+
+
+def test_yaml_handler_cache_tracks_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("id: 1\n")
+
+    first = yaml_handler(config_path)
+    first[0]["id"] = "mutated"
+    assert yaml_handler(config_path) == [{"id": 1}]
+
+    config_path.write_text("id: 22\n")
+    assert yaml_handler(config_path) == [{"id": 22}]
+
+
+def test_yaml_handler_directory_order(tmp_path: Path) -> None:
+    for name in ("c.yaml", "a.yaml", "nested/b.yaml", "d.yml"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text(f"name: {name}\n")
+
+    names = [config["name"] for config in yaml_handler(tmp_path)]
+    assert names == ["a.yaml", "c.yaml", "nested/b.yaml", "d.yml"]
+
+
+def test_yaml_handler_json_sidecar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SPEARMINT_YAML_JSON_CACHE", "1")
+    config_path = tmp_path / "sidecar.yaml"
+    config_path.write_text("llm:\n  model: gpt-4\n")
+
+    assert yaml_handler(config_path) == [{"llm": {"model": "gpt-4"}}]
+    assert json.loads((tmp_path / "sidecar.yaml.json").read_text()) == {"llm": {"model": "gpt-4"}}
+
+
+def test_yaml_handler_reads_json_config(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"llm": {"model": "gpt-4"}}')
+
+    configs = parse_configs([str(config_path)], yaml_handler)
+    assert configs[0]["llm"] == {"model": "gpt-4"}
+
+
+def test_compile_yaml_sidecars(tmp_path: Path) -> None:
+    (tmp_path / "a.yaml").write_text("id: a\n")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "b.yml").write_text("id: b\n")
+
+    written = compile_yaml_sidecars(tmp_path)
+
+    assert written == [tmp_path / "a.yaml.json", tmp_path / "nested" / "b.yml.json"]
+    assert json.loads(written[1].read_text()) == {"id": "b"}
+
+
+def test_parse_configs_preserves_mixed_order(tmp_path: Path) -> None:
+    (tmp_path / "b.yaml").write_text("id: b\n")
+    (tmp_path / "d.yaml").write_text("id: d\n")
+
+    configs = parse_configs(
+        [{"id": "a"}, tmp_path / "b.yaml", {"id": "c"}, str(tmp_path / "d.yaml")],
+        yaml_handler,
+    )
+
+    assert [config["id"] for config in configs] == ["a", "b", "c", "d"]
+
+
+def test_parse_configs_drops_duplicate_config_ids() -> None:
+    configs = parse_configs(
+        [{"id": DynamicValue([1, 2])}, {"id": DynamicValue([2, 3])}, {"id": 1}],
+        yaml_handler,
+    )
+
+    assert [config["id"] for config in configs] == [1, 2, 3]
+
+
+def test_parse_configs_keeps_distinct_configs_sharing_an_id(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    configs = parse_configs([{"config_id": "exp", "m": DynamicValue(["a", "b"])}], yaml_handler)
+
+    assert [config["m"] for config in configs] == ["a", "b"]
+    assert "different contents" in caplog.text
+
+
+def test_yaml_configs_load_lazily(tmp_path: Path) -> None:
+    config_path = tmp_path / "lazy.yaml"
+    mint = Spearmint(configs=[config_path])
+
+    @mint.experiment()
+    def process(value: str, config: Config) -> str:
+        return f"{value}_{config['id']}"
+
+    # Nothing is read until the experiment first needs its configs
+    config_path.write_text("id: lazy\n")
+    assert process("test") == "test_lazy"
+
+
 def _iter_cookbook_scripts() -> Iterable[Path]:
     repo_root = Path(__file__).resolve().parents[2]
     cookbook_root = repo_root / "cookbook"